@@ -1,12 +1,18 @@
 import os
+import json
+import time
 import uuid
+import base64
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List
-from fastapi import FastAPI, Depends, HTTPException
+from typing import Annotated, Dict, List, Tuple
+from fastapi import FastAPI, Depends, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, text, tuple_, literal
 
 # Configure logging
 logging.basicConfig(
@@ -20,53 +26,91 @@ from .models import MessageLog
 from .schemas import (
     QueryGenerateRequest, QueryGenerateResponse,
     AnswerGenerateRequest, AnswerGenerateResponse,
-    ChatRequest, ChatResponse, MessageLog as MessageLogSchema
-)
-from .services.llm_service import llm_service
-from .services.mcp_client import mcp_client
-
-# Create FastAPI app
-app = FastAPI(
-    title="RAG Chatbot API",
-    description="A RAG-based chatbot API with MCP integration",
-    version="1.0.0"
-)
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, specify exact origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    ChatRequest, ChatResponse, ConversationMessage,
+    MessageCountResponse, HealthResponse, MessageLog as MessageLogSchema
 )
+from .services.llm_service import LLMService
+from .services.mcp_client import MCPClient
+from .services.message_logger import MessageLogWriter
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database tables on startup."""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared services on startup and release them on shutdown."""
     try:
         logger.info("Starting up RAG Chatbot API...")
-        create_tables()
+        await create_tables()
         logger.info("Database tables created successfully")
         
+        app.state.mcp_client = MCPClient()
+        app.state.llm_service = LLMService()
+        app.state.message_log_writer = MessageLogWriter()
+        app.state.message_log_writer.start()
+        
         # Test MCP server connection
-        mcp_health = await mcp_client.health_check()
+        mcp_health = await app.state.mcp_client.health_check()
         if mcp_health:
             logger.info("MCP server is healthy")
         else:
             logger.warning("MCP server health check failed - will use fallback mode")
         
+        # Open the LLM API connection now so the first request doesn't pay the handshake
+        if await app.state.llm_service.warm_up():
+            logger.info("LLM connection warmed up")
+        else:
+            logger.warning("LLM warm-up failed - first request will connect lazily")
+        
         logger.info("RAG Chatbot API startup completed")
     except Exception as e:
         logger.error(f"Startup failed: {e}")
         raise
+    
+    yield
+    
+    await app.state.message_log_writer.stop()
+    await app.state.mcp_client.close()
+    await app.state.llm_service.close()
+
+
+async def get_mcp_client(request: Request) -> MCPClient:
+    """Dependency to get the shared MCP client."""
+    return request.app.state.mcp_client
+
+
+async def get_llm_service(request: Request) -> LLMService:
+    """Dependency to get the shared LLM service."""
+    return request.app.state.llm_service
+
+
+async def get_message_log_writer(request: Request) -> MessageLogWriter:
+    """Dependency to get the shared message log writer."""
+    return request.app.state.message_log_writer
+
+
+DBSession = Annotated[AsyncSession, Depends(get_async_db)]
+MCPClientDep = Annotated[MCPClient, Depends(get_mcp_client)]
+LLMServiceDep = Annotated[LLMService, Depends(get_llm_service)]
+MessageLogWriterDep = Annotated[MessageLogWriter, Depends(get_message_log_writer)]
 
+# Create FastAPI app
+app = FastAPI(
+    title="RAG Chatbot API",
+    description="A RAG-based chatbot API with MCP integration",
+    version="1.0.0",
+    lifespan=lifespan
+)
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Clean up resources on shutdown."""
-    await mcp_client.close()
+# Add CORS middleware; browsers cache the preflight for max_age seconds
+CORS_ALLOW_ORIGINS = os.getenv("CORS_ALLOW_ORIGINS", "http://localhost:3000,http://localhost:3001")
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=[origin.strip() for origin in CORS_ALLOW_ORIGINS.split(",") if origin.strip()],
+    allow_credentials=True,
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    expose_headers=["X-Next-Cursor"],
+    max_age=86400,
+)
 
 
 @app.get("/")
@@ -75,141 +119,312 @@ async def root():
     return {"message": "RAG Chatbot API is running"}
 
 
-@app.get("/health")
+@app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "timestamp": datetime.utcnow()}
+    return {"status": "healthy", "timestamp": time.time()}
+
+
+@app.post("/admin/reload")
+async def reload_mcp_content(mcp_client: MCPClientDep):
+    """Invalidate cached MCP prompts and FAQ content."""
+    mcp_client.clear_cache()
+    return {"status": "reloaded"}
+
+
+async def _refine_query(
+    llm_service: LLMService,
+    mcp_client: MCPClient,
+    user_query: str,
+    conversation_history: List[ConversationMessage]
+) -> str:
+    """Generate refined query from user query and conversation history."""
+    # Get query generation prompt from MCP server
+    prompt_template = await mcp_client.get_query_prompt()
+    
+    # Generate refined query using LLM
+    return await llm_service.generate_query(
+        user_query=user_query,
+        conversation_history=conversation_history,
+        prompt_template=prompt_template
+    )
+
+
+def _fetch_answer_context(mcp_client: MCPClient) -> asyncio.Future:
+    """Start fetching FAQ content and answer generation prompt from MCP server."""
+    return asyncio.gather(
+        mcp_client.get_faq_content(),
+        mcp_client.get_answer_prompt()
+    )
+
+
+def _abandon_answer_context(answer_context: asyncio.Future):
+    """Cancel an answer context prefetch and retrieve any error it ended with."""
+    answer_context.cancel()
+    answer_context.add_done_callback(
+        lambda future: future.cancelled() or future.exception()
+    )
+
+
+async def _generate_answer(
+    llm_service: LLMService,
+    refined_query: str,
+    answer_context: asyncio.Future
+) -> str:
+    """Generate answer from refined query once the FAQ/prompt fetch completes."""
+    faq_content, prompt_template = await answer_context
+    
+    # Generate answer using LLM
+    return await llm_service.generate_answer(
+        refined_query=refined_query,
+        faq_content=faq_content,
+        prompt_template=prompt_template
+    )
 
 
 @app.post("/query_generate", response_model=QueryGenerateResponse)
-async def query_generate(request: QueryGenerateRequest):
+async def query_generate(
+    request: QueryGenerateRequest,
+    llm_service: LLMServiceDep,
+    mcp_client: MCPClientDep
+):
     """Generate refined query from user query and conversation history."""
     try:
-        # Get query generation prompt from MCP server
-        prompt_template = await mcp_client.get_query_prompt()
-        
-        # Generate refined query using LLM
-        refined_query = await llm_service.generate_query(
-            user_query=request.user_query,
-            conversation_history=request.conversation_history,
-            prompt_template=prompt_template
-        )
-        
-        return QueryGenerateResponse(
-            refined_query=refined_query,
-            original_query=request.user_query
+        refined_query = await _refine_query(
+            llm_service, mcp_client, request.user_query, request.conversation_history
         )
-    
     except Exception as e:
         logger.error(f"Query generation failed: {e}")
         raise HTTPException(status_code=500, detail=f"Query generation failed: {str(e)}")
+    
+    return QueryGenerateResponse(
+        refined_query=refined_query,
+        original_query=request.user_query
+    )
 
 
 @app.post("/answer_generate", response_model=AnswerGenerateResponse)
-async def answer_generate(request: AnswerGenerateRequest):
+async def answer_generate(
+    request: AnswerGenerateRequest,
+    llm_service: LLMServiceDep,
+    mcp_client: MCPClientDep
+):
     """Generate answer from refined query and FAQ content."""
     try:
-        # Get FAQ content and answer generation prompt from MCP server
-        faq_content = await mcp_client.get_faq_content()
-        prompt_template = await mcp_client.get_answer_prompt()
-        
-        # Generate answer using LLM
-        answer = await llm_service.generate_answer(
-            refined_query=request.refined_query,
-            faq_content=faq_content,
-            prompt_template=prompt_template
-        )
-        
-        return AnswerGenerateResponse(
-            answer=answer,
-            refined_query=request.refined_query,
-            original_query=request.original_query
+        answer = await _generate_answer(
+            llm_service, request.refined_query, _fetch_answer_context(mcp_client)
         )
-    
     except Exception as e:
         logger.error(f"Answer generation failed: {e}")
         raise HTTPException(status_code=500, detail=f"Answer generation failed: {str(e)}")
+    
+    return AnswerGenerateResponse(
+        answer=answer,
+        refined_query=request.refined_query,
+        original_query=request.original_query
+    )
 
 
 @app.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest, db: AsyncSession = Depends(get_async_db)):
+async def chat(
+    request: ChatRequest,
+    llm_service: LLMServiceDep,
+    mcp_client: MCPClientDep,
+    message_log_writer: MessageLogWriterDep
+):
     """Complete chat pipeline: query generation + answer generation + logging."""
+    # FAQ and answer prompt don't depend on the refined query, so fetch them
+    # while the query is being generated
+    answer_context = _fetch_answer_context(mcp_client)
     try:
         # Step 1: Generate refined query
-        query_request = QueryGenerateRequest(
-            user_query=request.user_query,
-            conversation_history=request.conversation_history
+        refined_query = await _refine_query(
+            llm_service, mcp_client, request.user_query, request.conversation_history
         )
-        query_response = await query_generate(query_request)
         
         # Step 2: Generate answer
-        answer_request = AnswerGenerateRequest(
-            refined_query=query_response.refined_query,
-            original_query=request.user_query,
-            conversation_history=request.conversation_history
-        )
-        answer_response = await answer_generate(answer_request)
-        
-        # Step 3: Log to database
-        conversation_id = str(uuid.uuid4())
-        message_log = MessageLog(
-            user_query=request.user_query,
-            refined_query=query_response.refined_query,
-            answer=answer_response.answer,
-            conversation_id=conversation_id,
-            timestamp=datetime.utcnow()
-        )
-        
-        db.add(message_log)
-        await db.commit()
-        await db.refresh(message_log)
-        
-        return ChatResponse(
-            answer=answer_response.answer,
-            refined_query=query_response.refined_query,
-            original_query=request.user_query,
-            conversation_id=conversation_id
-        )
+        answer = await _generate_answer(llm_service, refined_query, answer_context)
+    
+    except Exception as e:
+        _abandon_answer_context(answer_context)
+        logger.error(f"Chat processing failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Chat processing failed: {str(e)}")
+    
+    # Step 3: Queue the log row; it is written to the database in the next batch
+    conversation_id = uuid.uuid4().hex
+    await message_log_writer.log({
+        "user_query": request.user_query,
+        "refined_query": refined_query,
+        "answer": answer,
+        "conversation_id": conversation_id
+    })
+    
+    return ChatResponse(
+        answer=answer,
+        refined_query=refined_query,
+        original_query=request.user_query,
+        conversation_id=conversation_id
+    )
+
+
+def _sse(payload: dict) -> str:
+    """Format a payload as a server-sent event."""
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+@app.post("/chat/stream")
+async def chat_stream(
+    request: ChatRequest,
+    llm_service: LLMServiceDep,
+    mcp_client: MCPClientDep,
+    message_log_writer: MessageLogWriterDep
+):
+    """Chat pipeline that streams the answer as server-sent events.
     
+    Emits a `meta` event with the refined query and conversation ID, a `token`
+    event per answer chunk, then `done` with the full answer (or `error`).
+    """
+    answer_context = _fetch_answer_context(mcp_client)
+    try:
+        refined_query = await _refine_query(
+            llm_service, mcp_client, request.user_query, request.conversation_history
+        )
+        faq_content, prompt_template = await answer_context
     except Exception as e:
-        await db.rollback()
+        _abandon_answer_context(answer_context)
         logger.error(f"Chat processing failed: {e}")
         raise HTTPException(status_code=500, detail=f"Chat processing failed: {str(e)}")
+    
+    conversation_id = uuid.uuid4().hex
+    
+    async def events():
+        yield _sse({
+            "type": "meta",
+            "refined_query": refined_query,
+            "original_query": request.user_query,
+            "conversation_id": conversation_id
+        })
+        
+        chunks = []
+        try:
+            async for chunk in llm_service.stream_answer(
+                refined_query=refined_query,
+                faq_content=faq_content,
+                prompt_template=prompt_template
+            ):
+                chunks.append(chunk)
+                yield _sse({"type": "token", "content": chunk})
+        except Exception as e:
+            logger.error(f"Chat streaming failed: {e}")
+            yield _sse({"type": "error", "detail": f"Chat processing failed: {str(e)}"})
+            return
+        
+        answer = "".join(chunks).strip()
+        await message_log_writer.log({
+            "user_query": request.user_query,
+            "refined_query": refined_query,
+            "answer": answer,
+            "conversation_id": conversation_id
+        })
+        yield _sse({"type": "done", "answer": answer})
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _encode_cursor(timestamp: datetime, message_id: int) -> str:
+    """Encode the position of a message as an opaque pagination cursor."""
+    raw = f"{timestamp.isoformat()}|{message_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a pagination cursor into (timestamp, id)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, message_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(timestamp), int(message_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 @app.get("/messages", response_model=List[MessageLogSchema])
 async def get_messages(
+    response: Response,
+    db: DBSession,
     limit: int = 100,
     offset: int = 0,
-    conversation_id: str = None,
-    db: AsyncSession = Depends(get_async_db)
+    cursor: str = None,
+    conversation_id: str = None
 ):
-    """Get logged messages with optional filtering."""
+    """Get logged messages with optional filtering.
+    
+    Pass the X-Next-Cursor header of a page as `cursor` to fetch the next one;
+    unlike `offset`, this does not scan the skipped rows.
+    """
+    position = _decode_cursor(cursor) if cursor else None
     try:
-        query = select(MessageLog).order_by(MessageLog.timestamp.desc())
+        query = select(MessageLog).order_by(MessageLog.timestamp.desc(), MessageLog.id.desc())
         
         if conversation_id:
             query = query.where(MessageLog.conversation_id == conversation_id)
         
-        query = query.offset(offset).limit(limit)
+        if position:
+            timestamp, message_id = position
+            query = query.where(
+                tuple_(MessageLog.timestamp, MessageLog.id)
+                < tuple_(literal(timestamp, MessageLog.timestamp.type), literal(message_id, MessageLog.id.type))
+            )
+        else:
+            query = query.offset(offset)
+        
+        query = query.limit(limit)
         
-        result = await db.execute(query)
-        messages = result.scalars().all()
+        result = await db.stream_scalars(query.execution_options(yield_per=200))
+        messages = [MessageLogSchema.model_validate(msg) async for msg in result]
+        
+        if messages and len(messages) == limit:
+            last = messages[-1]
+            response.headers["X-Next-Cursor"] = _encode_cursor(last.timestamp, last.id)
         
-        return [MessageLogSchema.from_orm(msg) for msg in messages]
+        return messages
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch messages: {str(e)}")
 
 
-@app.get("/messages/count")
+# Short-lived per-conversation counts: conversation_id -> (fetched_at, count)
+COUNT_CACHE_TTL = 5.0
+COUNT_CACHE_MAX_SIZE = 1024
+_count_cache: Dict[str, Tuple[float, int]] = {}
+
+
+@app.get("/messages/count", response_model=MessageCountResponse)
 async def get_message_count(
-    conversation_id: str = None,
-    db: AsyncSession = Depends(get_async_db)
+    db: DBSession,
+    conversation_id: str = None
 ):
-    """Get total count of logged messages."""
+    """Get total count of logged messages.
+    
+    The unfiltered total is the planner's row estimate rather than an exact
+    COUNT(*), which would scan the whole table.
+    """
     try:
-        from sqlalchemy import func
+        if not conversation_id:
+            result = await db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'message_logs'::regclass")
+            )
+            count = result.scalar()
+            # reltuples is -1 until the table has been vacuumed or analyzed
+            if count is not None and count >= 0:
+                return {"count": count}
+        else:
+            cached = _count_cache.get(conversation_id)
+            if cached is not None and time.monotonic() - cached[0] < COUNT_CACHE_TTL:
+                return {"count": cached[1]}
         
         query = select(func.count(MessageLog.id))
         
@@ -219,6 +434,11 @@ async def get_message_count(
         result = await db.execute(query)
         count = result.scalar()
         
+        if conversation_id:
+            if len(_count_cache) >= COUNT_CACHE_MAX_SIZE:
+                _count_cache.clear()
+            _count_cache[conversation_id] = (time.monotonic(), count)
+        
         return {"count": count}
     
     except Exception as e:
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 
@@ -14,8 +14,20 @@ class MessageLog(Base):
     user_query = Column(Text, nullable=False)
     refined_query = Column(Text, nullable=False)
     answer = Column(Text, nullable=False)
-    conversation_id = Column(String(100), nullable=True, index=True)
+    conversation_id = Column(String(100), nullable=True)
     timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     def __repr__(self):
-        return f"<MessageLog(id={self.id}, timestamp={self.timestamp})>"
\ No newline at end of file
+        return f"<MessageLog(id={self.id}, timestamp={self.timestamp})>"
+
+
+# Supports keyset pagination over ORDER BY timestamp DESC, id DESC
+Index("idx_message_logs_timestamp_id", MessageLog.timestamp.desc(), MessageLog.id.desc())
+
+# Serves conversation-filtered listings in the same order, and lookups by conversation_id
+Index(
+    "idx_message_logs_conversation_timestamp",
+    MessageLog.conversation_id,
+    MessageLog.timestamp.desc(),
+    MessageLog.id.desc()
+)
\ No newline at end of file
@@ -50,6 +50,17 @@ class ChatResponse(BaseModel):
     conversation_id: Optional[str] = None
 
 
+class MessageCountResponse(BaseModel):
+    """Response from message count endpoint."""
+    count: int
+
+
+class HealthResponse(BaseModel):
+    """Response from health check endpoint."""
+    status: str
+    timestamp: float
+
+
 class MessageLog(BaseModel):
     """Database model for message logging."""
     id: Optional[int] = None
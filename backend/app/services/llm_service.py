@@ -1,7 +1,9 @@
 import os
-from typing import List
+import asyncio
+from typing import AsyncIterator, List
+import httpx
 from langchain_openai import ChatOpenAI
-from langchain.schema import HumanMessage, AIMessage, SystemMessage
+from langchain.schema import BaseMessage, HumanMessage, AIMessage, SystemMessage
 from ..schemas import ConversationMessage
 
 
@@ -13,23 +15,32 @@ class LLMService:
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
         
+        # Shared pooled client; HTTP/2 multiplexes concurrent completions over one connection
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+        
         self.llm = ChatOpenAI(
             model="gpt-3.5-turbo",
             temperature=0.1,
-            openai_api_key=api_key
+            openai_api_key=api_key,
+            http_async_client=self.http_client
         )
+        
+        # System prompts are constant, so build the messages once
+        self._sys_query = SystemMessage(content="You are a helpful assistant that refines user queries.")
+        self._sys_answer = SystemMessage(content="You are a helpful customer support assistant.")
     
     def _format_conversation_history(self, history: List[ConversationMessage]) -> str:
         """Format conversation history for prompt."""
         if not history:
             return "No previous conversation."
         
-        formatted = []
-        for msg in history:
-            role = "User" if msg.role == "user" else "Assistant"
-            formatted.append(f"{role}: {msg.content}")
-        
-        return "\n".join(formatted)
+        return "\n".join(
+            f"{'User' if msg.role == 'user' else 'Assistant'}: {msg.content}"
+            for msg in history
+        )
     
     async def generate_query(self, user_query: str, conversation_history: List[ConversationMessage], prompt_template: str) -> str:
         """Generate refined query using LLM."""
@@ -45,7 +56,7 @@ class LLMService:
         
         # Create messages
         messages = [
-            SystemMessage(content="You are a helpful assistant that refines user queries."),
+            self._sys_query,
             HumanMessage(content=prompt)
         ]
         
@@ -53,8 +64,8 @@ class LLMService:
         response = await self.llm.ainvoke(messages)
         return response.content.strip()
     
-    async def generate_answer(self, refined_query: str, faq_content: str, prompt_template: str) -> str:
-        """Generate answer using LLM."""
+    def _answer_messages(self, refined_query: str, faq_content: str, prompt_template: str) -> List[BaseMessage]:
+        """Build the messages for answer generation."""
         
         # Fill in the prompt template
         prompt = prompt_template.format(
@@ -63,15 +74,38 @@ class LLMService:
         )
         
         # Create messages
-        messages = [
-            SystemMessage(content="You are a helpful customer support assistant."),
+        return [
+            self._sys_answer,
             HumanMessage(content=prompt)
         ]
+    
+    async def generate_answer(self, refined_query: str, faq_content: str, prompt_template: str) -> str:
+        """Generate answer using LLM."""
+        messages = self._answer_messages(refined_query, faq_content, prompt_template)
         
         # Get response from LLM
         response = await self.llm.ainvoke(messages)
         return response.content.strip()
-
-
-# Global LLM service instance
-llm_service = LLMService()
\ No newline at end of file
+    
+    async def stream_answer(self, refined_query: str, faq_content: str, prompt_template: str) -> AsyncIterator[str]:
+        """Generate answer using LLM, yielding text chunks as they arrive."""
+        messages = self._answer_messages(refined_query, faq_content, prompt_template)
+        
+        async for chunk in self.llm.astream(messages):
+            if chunk.content:
+                yield chunk.content
+    
+    async def warm_up(self, timeout: float = 10.0) -> bool:
+        """Open the connection to the LLM API ahead of the first request."""
+        try:
+            await asyncio.wait_for(
+                self.llm.bind(max_tokens=1).ainvoke([HumanMessage(content="ping")]),
+                timeout
+            )
+            return True
+        except Exception:
+            return False
+    
+    async def close(self):
+        """Close the HTTP client."""
+        await self.http_client.aclose()
\ No newline at end of file
@@ -1,6 +1,7 @@
 import asyncio
 import json
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Tuple
 import httpx
 import os
 from pathlib import Path
@@ -13,15 +14,70 @@ class MCPClient:
         if mcp_server_url is None:
             mcp_server_url = os.getenv("MCP_SERVER_URL", "http://mcp_server:8001")
         self.mcp_server_url = mcp_server_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # When set, prompts and FAQ are read straight from this directory instead of over HTTP
+        self.local_path = os.getenv("MCP_LOCAL_PATH")
+        self.client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+        self.cache_ttl = float(os.getenv("MCP_CACHE_TTL", "300"))
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._local_cache: Dict[str, str] = {}
+    
+    def _read_local(self, relative_path: str) -> str:
+        """Read a file from the local MCP directory, memoized since the files are static."""
+        content = self._local_cache.get(relative_path)
+        if content is None:
+            with open(Path(self.local_path) / relative_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            self._local_cache[relative_path] = content
+        return content
+    
+    def _get_fresh(self, path: str, ttl: float) -> Dict[str, Any]:
+        """Return the cached response for path if it is younger than ttl, else None."""
+        cached = self._cache.get(path)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        return None
+    
+    async def _cached_get(self, path: str, ttl: float = None) -> Dict[str, Any]:
+        """Get a JSON response from MCP server, serving it from the in-process cache while fresh."""
+        if ttl is None:
+            ttl = self.cache_ttl
+        
+        result = self._get_fresh(path, ttl)
+        if result is not None:
+            return result
+        
+        # Coalesce concurrent misses for the same path into a single request
+        async with self._locks.setdefault(path, asyncio.Lock()):
+            result = self._get_fresh(path, ttl)
+            if result is not None:
+                return result
+            
+            response = await self.client.get(f"{self.mcp_server_url}{path}")
+            response.raise_for_status()
+            result = response.json()
+            self._cache[path] = (time.monotonic(), result)
+            return result
+    
+    def clear_cache(self):
+        """Drop cached MCP content so the next request refetches it."""
+        self._cache.clear()
+        self._local_cache.clear()
+    
+    async def get_bundle(self) -> Dict[str, str]:
+        """Get FAQ content and both prompts from MCP server in one request."""
+        return await self._cached_get("/bundle")
     
     async def get_faq_content(self) -> str:
         """Get FAQ content from MCP server."""
+        if self.local_path:
+            return self._read_local("resources/faq.txt")
         try:
-            response = await self.client.get(f"{self.mcp_server_url}/resources/faq")
-            response.raise_for_status()
-            result = response.json()
-            return result.get("content", "")
+            bundle = await self.get_bundle()
+            return bundle["faq"]
         except Exception as e:
             # Fallback to direct file reading if MCP server is not available
             print(f"Warning: Could not connect to MCP server ({e}), falling back to local file")
@@ -38,11 +94,11 @@ class MCPClient:
     
     async def get_query_prompt(self) -> str:
         """Get query generation prompt from MCP server."""
+        if self.local_path:
+            return self._read_local("prompts/query_generate.txt")
         try:
-            response = await self.client.get(f"{self.mcp_server_url}/prompts/query_generate")
-            response.raise_for_status()
-            result = response.json()
-            return result.get("content", "")
+            bundle = await self.get_bundle()
+            return bundle["query_prompt"]
         except Exception as e:
             # Fallback to direct file reading
             print(f"Warning: Could not connect to MCP server ({e}), falling back to local file")
@@ -58,11 +114,11 @@ class MCPClient:
     
     async def get_answer_prompt(self) -> str:
         """Get answer generation prompt from MCP server."""
+        if self.local_path:
+            return self._read_local("prompts/answer_generate.txt")
         try:
-            response = await self.client.get(f"{self.mcp_server_url}/prompts/answer_generate")
-            response.raise_for_status()
-            result = response.json()
-            return result.get("content", "")
+            bundle = await self.get_bundle()
+            return bundle["answer_prompt"]
         except Exception as e:
             # Fallback to direct file reading
             print(f"Warning: Could not connect to MCP server ({e}), falling back to local file")
@@ -78,6 +134,8 @@ class MCPClient:
     
     async def health_check(self) -> bool:
         """Check if MCP server is healthy."""
+        if self.local_path:
+            return Path(self.local_path).is_dir()
         try:
             response = await self.client.get(f"{self.mcp_server_url}/health")
             return response.status_code == 200
@@ -86,8 +144,4 @@ class MCPClient:
     
     async def close(self):
         """Close the HTTP client."""
-        await self.client.aclose()
-
-
-# Global MCP client instance
-mcp_client = MCPClient()
\ No newline at end of file
+        await self.client.aclose()
\ No newline at end of file
@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from typing import Any, Dict, List
+from sqlalchemy import insert
+from ..database import AsyncSessionLocal
+from ..models import MessageLog
+
+logger = logging.getLogger(__name__)
+
+# Queued after the last row to tell the worker to flush and exit
+_STOP = object()
+
+
+class MessageLogWriter:
+    """Buffers message logs and writes them to the database in batches."""
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 0.1):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue: asyncio.Queue = None
+        self._worker: asyncio.Task = None
+
+    def start(self):
+        """Start the background flush worker on the running event loop."""
+        self.queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def log(self, row: Dict[str, Any]):
+        """Queue a message log row for the next batch insert."""
+        await self.queue.put(row)
+
+    async def _collect_batch(self) -> List[Any]:
+        """Wait for a row, then gather more until the batch is full or the interval elapses."""
+        batch = [await self.queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+
+        while batch[-1] is not _STOP and len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _flush(self, rows: List[Dict[str, Any]]):
+        """Insert rows in a single multi-row INSERT."""
+        if not rows:
+            return
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(insert(MessageLog), rows)
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Failed to write {len(rows)} message logs: {e}")
+
+    async def _run(self):
+        """Flush batches until a stop marker is received."""
+        while True:
+            batch = await self._collect_batch()
+            if batch[-1] is _STOP:
+                await self._flush(batch[:-1])
+                return
+            await self._flush(batch)
+
+    async def stop(self):
+        """Flush any queued rows and stop the worker."""
+        if self._worker is None:
+            return
+        await self.queue.put(_STOP)
+        await self._worker
+        self._worker = None
\ No newline at end of file
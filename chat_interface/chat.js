@@ -140,8 +140,8 @@ async function sendMessage() {
     showTypingIndicator();
     
     try {
-        // Send to backend
-        const response = await fetch(`${API_BASE_URL}/chat`, {
+        // Send to backend; the answer is streamed back as server-sent events
+        const response = await fetch(`${API_BASE_URL}/chat/stream`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -156,26 +156,43 @@ async function sendMessage() {
             throw new Error(`HTTP ${response.status}: ${response.statusText}`);
         }
         
-        const data = await response.json();
+        let answer = '';
+        let answerElement = null;
         
-        // Hide typing indicator
-        hideTypingIndicator();
+        await readEventStream(response, (data) => {
+            if (data.type === 'meta') {
+                // Update conversation ID if provided
+                if (data.conversation_id) {
+                    currentConversationId = data.conversation_id;
+                }
+            } else if (data.type === 'token') {
+                // Replace typing indicator with the bot response on the first chunk
+                if (!answerElement) {
+                    hideTypingIndicator();
+                    answerElement = addMessage('', 'bot');
+                }
+                answer += data.content;
+                answerElement.textContent = answer;
+                scrollToBottom();
+            } else if (data.type === 'done') {
+                answer = data.answer;
+            } else if (data.type === 'error') {
+                throw new Error(data.detail);
+            }
+        });
         
-        // Add bot response
-        addMessage(data.answer, 'bot');
+        if (!answerElement) {
+            hideTypingIndicator();
+            addMessage(answer, 'bot');
+        }
         
         // Add to conversation history
         conversationHistory.push({
             role: 'assistant',
-            content: data.answer,
+            content: answer,
             timestamp: new Date().toISOString()
         });
         
-        // Update conversation ID if provided
-        if (data.conversation_id) {
-            currentConversationId = data.conversation_id;
-        }
-        
         // Save conversation to local storage
         saveConversationToStorage();
         
@@ -191,6 +208,27 @@ async function sendMessage() {
     }
 }
 
+async function readEventStream(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        
+        buffer += decoder.decode(value, { stream: true });
+        const events = buffer.split('\n\n');
+        buffer = events.pop();
+        
+        for (const event of events) {
+            if (event.startsWith('data: ')) {
+                onEvent(JSON.parse(event.slice(6)));
+            }
+        }
+    }
+}
+
 function addMessage(content, sender, isError = false) {
     const chatMessages = document.getElementById('chatMessages');
     const messageDiv = document.createElement('div');
@@ -217,6 +255,8 @@ function addMessage(content, sender, isError = false) {
     
     chatMessages.appendChild(messageDiv);
     scrollToBottom();
+    
+    return messageDiv.querySelector('.message-bubble p');
 }
 
 function showTypingIndicator() {
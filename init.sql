@@ -15,8 +15,8 @@ CREATE TABLE IF NOT EXISTS message_logs (
 );
 
 -- Create indexes for better performance
-CREATE INDEX IF NOT EXISTS idx_message_logs_timestamp ON message_logs(timestamp);
-CREATE INDEX IF NOT EXISTS idx_message_logs_conversation_id ON message_logs(conversation_id);
+CREATE INDEX IF NOT EXISTS idx_message_logs_timestamp_id ON message_logs(timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_message_logs_conversation_timestamp ON message_logs(conversation_id, timestamp DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_message_logs_user_query ON message_logs USING gin(to_tsvector('english', user_query));
 
 -- Insert some sample data for testing
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 import asyncio
+import json
 import os
 from pathlib import Path
-from fastapi import FastAPI, HTTPException
+from typing import Dict, Tuple
+from fastapi import FastAPI, HTTPException, Response
 import uvicorn
 
 
@@ -12,8 +14,27 @@ class RAGMCPServer:
     def __init__(self):
         self.app = FastAPI(title="RAG MCP Server", version="1.0.0")
         self.base_path = Path(__file__).parent
+        # Encoded response bodies keyed by route, with the mtimes of the files they were built from
+        self._cache: Dict[str, Tuple[Tuple[float, ...], bytes]] = {}
         self.setup_routes()
     
+    def _read_file(self, relative_path: str) -> str:
+        """Read a resource or prompt file relative to the server directory."""
+        with open(self.base_path / relative_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    def _json_response(self, key: str, files: Dict[str, str]) -> Response:
+        """Serve files as a JSON object, re-reading and re-encoding only when one has changed."""
+        mtimes = tuple((self.base_path / path).stat().st_mtime for path in files.values())
+        cached = self._cache.get(key)
+        if cached is None or cached[0] != mtimes:
+            body = json.dumps(
+                {field: self._read_file(path) for field, path in files.items()},
+                ensure_ascii=False
+            ).encode()
+            cached = self._cache[key] = (mtimes, body)
+        return Response(content=cached[1], media_type="application/json")
+    
     def setup_routes(self):
         """Set up HTTP routes."""
         
@@ -30,9 +51,7 @@ class RAGMCPServer:
             """Get FAQ content."""
             faq_path = self.base_path / "resources" / "faq.txt"
             try:
-                with open(faq_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                return {"content": content}
+                return self._json_response("resources/faq.txt", {"content": "resources/faq.txt"})
             except FileNotFoundError:
                 raise HTTPException(status_code=404, detail=f"FAQ file not found at {faq_path}")
             except Exception as e:
@@ -43,9 +62,7 @@ class RAGMCPServer:
             """Get query generation prompt."""
             prompt_path = self.base_path / "prompts" / "query_generate.txt"
             try:
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                return {"content": content}
+                return self._json_response("prompts/query_generate.txt", {"content": "prompts/query_generate.txt"})
             except FileNotFoundError:
                 raise HTTPException(status_code=404, detail=f"Query prompt file not found at {prompt_path}")
             except Exception as e:
@@ -56,13 +73,25 @@ class RAGMCPServer:
             """Get answer generation prompt."""
             prompt_path = self.base_path / "prompts" / "answer_generate.txt"
             try:
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                return {"content": content}
+                return self._json_response("prompts/answer_generate.txt", {"content": "prompts/answer_generate.txt"})
             except FileNotFoundError:
                 raise HTTPException(status_code=404, detail=f"Answer prompt file not found at {prompt_path}")
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Error reading answer prompt: {str(e)}")
+        
+        @self.app.get("/bundle")
+        async def get_bundle():
+            """Get FAQ content and both prompts in a single response."""
+            try:
+                return self._json_response("bundle", {
+                    "faq": "resources/faq.txt",
+                    "query_prompt": "prompts/query_generate.txt",
+                    "answer_prompt": "prompts/answer_generate.txt"
+                })
+            except FileNotFoundError as e:
+                raise HTTPException(status_code=404, detail=f"File not found at {e.filename}")
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Error reading bundle: {str(e)}")
 
 
 def main():
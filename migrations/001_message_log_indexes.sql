@@ -0,0 +1,13 @@
+-- Bring message_logs indexes of databases created from an older init.sql up to date.
+-- Run with: docker-compose exec -T postgres psql -U chatbot -d chatbot_db < migrations/001_message_log_indexes.sql
+
+-- Keyset pagination over ORDER BY timestamp DESC, id DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_message_logs_timestamp_id ON message_logs(timestamp DESC, id DESC);
+
+-- Conversation-scoped listing without an in-memory sort; also covers lookups by conversation_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_message_logs_conversation_timestamp ON message_logs(conversation_id, timestamp DESC, id DESC);
+
+-- Superseded by the composite indexes above
+DROP INDEX CONCURRENTLY IF EXISTS idx_message_logs_timestamp;
+DROP INDEX CONCURRENTLY IF EXISTS idx_message_logs_conversation_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_message_logs_conversation_id;
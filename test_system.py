@@ -4,191 +4,183 @@ Simple test script to verify the RAG Chatbot system is working correctly.
 Run this after starting the system with docker-compose.
 """
 
-import asyncio
-import json
+import importlib.util
 import sys
-from datetime import datetime
+from typing import Any, Tuple
+import anyio
 import httpx
 
+try:
+    # orjson decodes response bodies straight from bytes in C
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # API base URL
 BASE_URL = "http://localhost:8000"
 
-async def test_health():
+# HTTP/2 needs the h2 package (pip install 'httpx[http2]')
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# uvloop's event loop dispatches socket events faster than asyncio's own
+UVLOOP_AVAILABLE = importlib.util.find_spec("uvloop") is not None
+
+async def probe(client, method, url, *, payload=None) -> Tuple[bool, Any]:
+    """Send a request and return whether it succeeded with the decoded body, or the failure detail."""
+    try:
+        response = await client.request(method, url, json=payload)
+    except httpx.HTTPError as e:
+        return False, e
+    if response.status_code != 200:
+        return False, f"{response.status_code}\n   Response: {response.text}"
+    if response.headers.get("content-type", "").startswith("application/json"):
+        return True, json_loads(response.content)
+    return True, response.text
+
+async def run_test(results, index, test, client, out, *args):
+    """Run a test, storing its result, or the exception it raised, at results[index]."""
+    try:
+        results[index] = await test(client, out, *args)
+    except Exception as e:
+        results[index] = e
+
+async def test_health(client, out):
     """Test the health endpoint."""
-    print("🏥 Testing health endpoint...")
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(f"{BASE_URL}/health")
-            if response.status_code == 200:
-                print("✅ Health check passed")
-                return True
-            else:
-                print(f"❌ Health check failed: {response.status_code}")
-                return False
-        except Exception as e:
-            print(f"❌ Health check failed: {e}")
-            return False
+    out.append("🏥 Testing health endpoint...")
+    ok, body = await probe(client, "GET", "/health")
+    out.append("✅ Health check passed" if ok else f"❌ Health check failed: {body}")
+    return ok, body
 
-async def test_query_generate():
+async def test_query_generate(client, out):
     """Test the query generation endpoint."""
-    print("🔍 Testing query generation...")
-    async with httpx.AsyncClient() as client:
-        try:
-            data = {
-                "user_query": "What are your business hours?",
-                "conversation_history": []
-            }
-            response = await client.post(f"{BASE_URL}/query_generate", json=data)
-            
-            if response.status_code == 200:
-                result = response.json()
-                print(f"✅ Query generation successful")
-                print(f"   Original: {result['original_query']}")
-                print(f"   Refined:  {result['refined_query']}")
-                return result
-            else:
-                print(f"❌ Query generation failed: {response.status_code}")
-                print(f"   Response: {response.text}")
-                return None
-        except Exception as e:
-            print(f"❌ Query generation failed: {e}")
-            return None
+    out.append("🔍 Testing query generation...")
+    ok, result = await probe(client, "POST", "/query_generate", payload={
+        "user_query": "What are your business hours?",
+        "conversation_history": []
+    })
+    if not ok:
+        out.append(f"❌ Query generation failed: {result}")
+        return False, result
+    out.append("✅ Query generation successful")
+    out.append(f"   Original: {result['original_query']}")
+    out.append(f"   Refined:  {result['refined_query']}")
+    return True, result
 
-async def test_answer_generate(refined_query="What are the business hours for customer support?"):
+async def test_answer_generate(client, out, refined_query="What are the business hours for customer support?"):
     """Test the answer generation endpoint."""
-    print("💡 Testing answer generation...")
-    async with httpx.AsyncClient() as client:
-        try:
-            data = {
-                "refined_query": refined_query,
-                "original_query": "What are your business hours?",
-                "conversation_history": []
-            }
-            response = await client.post(f"{BASE_URL}/answer_generate", json=data)
-            
-            if response.status_code == 200:
-                result = response.json()
-                print(f"✅ Answer generation successful")
-                print(f"   Answer: {result['answer'][:100]}...")
-                return result
-            else:
-                print(f"❌ Answer generation failed: {response.status_code}")
-                print(f"   Response: {response.text}")
-                return None
-        except Exception as e:
-            print(f"❌ Answer generation failed: {e}")
-            return None
+    out.append("💡 Testing answer generation...")
+    ok, result = await probe(client, "POST", "/answer_generate", payload={
+        "refined_query": refined_query,
+        "original_query": "What are your business hours?",
+        "conversation_history": []
+    })
+    if not ok:
+        out.append(f"❌ Answer generation failed: {result}")
+        return False, result
+    out.append("✅ Answer generation successful")
+    out.append(f"   Answer: {result['answer'][:100]}...")
+    return True, result
 
-async def test_chat():
+async def test_chat(client, out):
     """Test the complete chat pipeline."""
-    print("💬 Testing complete chat pipeline...")
-    async with httpx.AsyncClient() as client:
-        try:
-            data = {
-                "user_query": "Do you offer free trials?",
-                "conversation_history": []
-            }
-            response = await client.post(f"{BASE_URL}/chat", json=data)
-            
-            if response.status_code == 200:
-                result = response.json()
-                print(f"✅ Chat pipeline successful")
-                print(f"   Original: {result['original_query']}")
-                print(f"   Refined:  {result['refined_query']}")
-                print(f"   Answer:   {result['answer'][:100]}...")
-                print(f"   Conv ID:  {result['conversation_id']}")
-                return result
-            else:
-                print(f"❌ Chat pipeline failed: {response.status_code}")
-                print(f"   Response: {response.text}")
-                return None
-        except Exception as e:
-            print(f"❌ Chat pipeline failed: {e}")
-            return None
+    out.append("💬 Testing complete chat pipeline...")
+    ok, result = await probe(client, "POST", "/chat", payload={
+        "user_query": "Do you offer free trials?",
+        "conversation_history": []
+    })
+    if not ok:
+        out.append(f"❌ Chat pipeline failed: {result}")
+        return False, result
+    out.append("✅ Chat pipeline successful")
+    out.append(f"   Original: {result['original_query']}")
+    out.append(f"   Refined:  {result['refined_query']}")
+    out.append(f"   Answer:   {result['answer'][:100]}...")
+    out.append(f"   Conv ID:  {result['conversation_id']}")
+    return True, result
 
-async def test_messages():
+async def test_messages(client, out):
     """Test the messages retrieval endpoint."""
-    print("📝 Testing messages retrieval...")
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(f"{BASE_URL}/messages?limit=5")
-            
-            if response.status_code == 200:
-                messages = response.json()
-                print(f"✅ Messages retrieval successful")
-                print(f"   Retrieved {len(messages)} messages")
-                return messages
-            else:
-                print(f"❌ Messages retrieval failed: {response.status_code}")
-                print(f"   Response: {response.text}")
-                return None
-        except Exception as e:
-            print(f"❌ Messages retrieval failed: {e}")
-            return None
+    out.append("📝 Testing messages retrieval...")
+    ok, messages = await probe(client, "GET", "/messages?limit=5")
+    if not ok:
+        out.append(f"❌ Messages retrieval failed: {messages}")
+        return False, messages
+    out.append("✅ Messages retrieval successful")
+    out.append(f"   Retrieved {len(messages)} messages")
+    return True, messages
 
-async def test_message_count():
+async def test_message_count(client, out):
     """Test the message count endpoint."""
-    print("🔢 Testing message count...")
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(f"{BASE_URL}/messages/count")
-            
-            if response.status_code == 200:
-                result = response.json()
-                print(f"✅ Message count successful: {result['count']} messages")
-                return result
-            else:
-                print(f"❌ Message count failed: {response.status_code}")
-                print(f"   Response: {response.text}")
-                return None
-        except Exception as e:
-            print(f"❌ Message count failed: {e}")
-            return None
+    out.append("🔢 Testing message count...")
+    ok, result = await probe(client, "GET", "/messages/count")
+    if not ok:
+        out.append(f"❌ Message count failed: {result}")
+        return False, result
+    out.append(f"✅ Message count successful: {result['count']} messages")
+    return True, result
 
 async def main():
     """Run all tests."""
     print("🚀 Starting RAG Chatbot System Tests")
     print("=" * 50)
     
-    success_count = 0
-    total_tests = 6
-    
-    # Test 1: Health check
-    if await test_health():
-        success_count += 1
-    print()
-    
-    # Test 2: Query generation
-    query_result = await test_query_generate()
-    if query_result:
-        success_count += 1
-    print()
+    # Label and function of each test, in report order
+    tests = (
+        ("Health check", test_health),
+        ("Query generation", test_query_generate),
+        ("Answer generation", test_answer_generate),
+        ("Chat pipeline", test_chat),
+        ("Messages retrieval", test_messages),
+        ("Message count", test_message_count)
+    )
     
-    # Test 3: Answer generation
-    refined_query = query_result.get('refined_query') if query_result else None
-    answer_result = await test_answer_generate(refined_query)
-    if answer_result:
-        success_count += 1
-    print()
+    success_count = 0
+    total_tests = len(tests)
+    failed = []
     
-    # Test 4: Complete chat pipeline
-    if await test_chat():
-        success_count += 1
-    print()
+    # Each test collects its output so concurrent tests don't interleave
+    outputs = [[] for _ in range(total_tests)]
     
-    # Test 5: Messages retrieval
-    if await test_messages():
-        success_count += 1
-    print()
+    # One pooled client keeps connections alive across all tests. HTTP/2 is
+    # negotiated over TLS, multiplexing the concurrent tests on one connection;
+    # plain http:// (Uvicorn) stays on HTTP/1.1 with a connection per request
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        http2=HTTP2_AVAILABLE,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30)
+    ) as client:
+        results = [None] * total_tests
+        
+        # All tests but answer generation are independent, so run them concurrently
+        async with anyio.create_task_group() as tg:
+            for index, (_, test) in enumerate(tests):
+                if test is not test_answer_generate:
+                    tg.start_soon(run_test, results, index, test, client, outputs[index])
+        query_result = results[1]
+        
+        # Test 3: Answer generation depends on the refined query from test 2
+        refined_query = None
+        if not isinstance(query_result, Exception) and query_result[0]:
+            refined_query = query_result[1]['refined_query']
+        await run_test(results, 2, test_answer_generate, client, outputs[2], refined_query)
     
-    # Test 6: Message count
-    if await test_message_count():
-        success_count += 1
-    print()
+    for (label, _), result, output in zip(tests, results, outputs):
+        if isinstance(result, Exception):
+            output.append(f"❌ Test crashed: {result}")
+            failed.append(f"{label} (crashed: {type(result).__name__})")
+        elif result[0]:
+            success_count += 1
+        else:
+            failed.append(label)
+        print("\n".join(output))
+        print()
     
     # Summary
     print("=" * 50)
     print(f"📊 Test Results: {success_count}/{total_tests} tests passed")
+    if failed:
+        print(f"   Failed: {', '.join(failed)}")
     
     if success_count == total_tests:
         print("🎉 All tests passed! Your RAG Chatbot system is working correctly.")
@@ -208,7 +200,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        exit_code = asyncio.run(main())
+        exit_code = anyio.run(main, backend_options={"use_uvloop": UVLOOP_AVAILABLE})
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\n🛑 Tests interrupted by user")
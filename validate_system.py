@@ -2,84 +2,194 @@
 """
 Comprehensive validation script for RAG Chatbot system.
 Checks all files, configurations, and system completeness.
+Set VALIDATE_FAIL_FAST=1 to stop at the first failing suite.
 """
 
+import asyncio
 import os
+import re
+import stat
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-def check_file_exists(file_path: str, description: str) -> bool:
-    """Check if a file exists and print result."""
-    if os.path.exists(file_path):
-        print(f"✅ {description}: {file_path}")
+# Project root; every checked path is resolved against it
+ROOT = Path(__file__).resolve().parent
+
+# Files that must exist, with what each one provides
+_CHECKS = tuple((ROOT / file_path, description) for file_path, description in [
+    # Root files
+    ("README.md", "Main documentation"),
+    ("docker-compose.yml", "Docker orchestration"),
+    ("init.sql", "Database initialization"),
+    ("start.sh", "Startup script"),
+    ("test_system.py", "System test script"),
+    (".env.example", "Environment template"),
+    
+    # Backend files
+    ("backend/Dockerfile", "Backend container config"),
+    ("backend/requirements.txt", "Backend dependencies"),
+    ("backend/app/__init__.py", "Backend package init"),
+    ("backend/app/main.py", "FastAPI application"),
+    ("backend/app/models.py", "Database models"),
+    ("backend/app/schemas.py", "Pydantic schemas"),
+    ("backend/app/database.py", "Database connection"),
+    ("backend/app/services/__init__.py", "Services package init"),
+    ("backend/app/services/llm_service.py", "LLM service"),
+    ("backend/app/services/mcp_client.py", "MCP client"),
+    
+    # MCP Server files
+    ("mcp_server/Dockerfile", "MCP server container config"),
+    ("mcp_server/requirements.txt", "MCP server dependencies"),
+    ("mcp_server/server.py", "MCP server implementation"),
+    ("mcp_server/resources/faq.txt", "FAQ content"),
+    ("mcp_server/prompts/query_generate.txt", "Query generation prompt"),
+    ("mcp_server/prompts/answer_generate.txt", "Answer generation prompt"),
+    
+    # Frontend files
+    ("frontend/Dockerfile", "Frontend container config"),
+    ("frontend/nginx.conf", "Nginx configuration"),
+    ("frontend/index.html", "Dashboard HTML"),
+    ("frontend/style.css", "Dashboard CSS"),
+    ("frontend/script.js", "Dashboard JavaScript"),
+    
+    # Chat Interface files
+    ("chat_interface/Dockerfile", "Chat interface container config"),
+    ("chat_interface/nginx.conf", "Chat interface nginx config"),
+    ("chat_interface/index.html", "Chat interface HTML"),
+    ("chat_interface/chat.css", "Chat interface CSS"),
+    ("chat_interface/chat.js", "Chat interface JavaScript"),
+])
+
+# Files read by the content, dependency and configuration checks
+_CONTENT_FILES = tuple(ROOT / file_path for file_path in (
+    "docker-compose.yml",
+    "backend/app/main.py",
+    "mcp_server/server.py",
+    "frontend/script.js",
+    "mcp_server/resources/faq.txt",
+    "backend/requirements.txt",
+    "mcp_server/requirements.txt",
+    ".env.example",
+    "frontend/nginx.conf",
+))
+
+def token_pattern(tokens: frozenset, ignore_case: bool = False) -> re.Pattern:
+    """Compile byte tokens into one alternation, longest first so no token is shadowed by its prefix."""
+    alternation = b"|".join(re.escape(token) for token in sorted(tokens, key=len, reverse=True))
+    return re.compile(alternation, re.IGNORECASE if ignore_case else 0)
+
+# Services docker-compose.yml must define
+_COMPOSE_SERVICES = frozenset({b"postgres", b"pgadmin", b"mcp_server", b"backend", b"frontend"})
+_COMPOSE_SERVICES_RE = token_pattern(_COMPOSE_SERVICES)
+
+# Endpoints the backend must expose
+_BACKEND_ENDPOINTS = frozenset({b"/query_generate", b"/answer_generate", b"/chat", b"/messages"})
+_BACKEND_ENDPOINTS_RE = token_pattern(_BACKEND_ENDPOINTS)
+
+# Routes the MCP server must serve
+_MCP_ROUTES = frozenset({b"/resources/faq", b"/prompts/query_generate", b"/prompts/answer_generate"})
+_MCP_ROUTES_RE = token_pattern(_MCP_ROUTES)
+
+# Functions the dashboard script must define
+_DASHBOARD_FUNCTIONS = frozenset({b"loadMessages", b"loadStats", b"searchMessages", b"showMessageDetails"})
+_DASHBOARD_FUNCTIONS_RE = token_pattern(_DASHBOARD_FUNCTIONS)
+
+# Packages each requirements file must list
+_BACKEND_PACKAGES = frozenset({b"fastapi", b"uvicorn", b"sqlalchemy", b"asyncpg", b"langchain", b"langchain-openai", b"httpx"})
+_BACKEND_PACKAGES_RE = token_pattern(_BACKEND_PACKAGES, ignore_case=True)
+_MCP_PACKAGES = frozenset({b"fastapi", b"uvicorn"})
+_MCP_PACKAGES_RE = token_pattern(_MCP_PACKAGES, ignore_case=True)
+
+# Variables .env.example must define
+_ENV_VARIABLES = frozenset({b"OPENAI_API_KEY", b"DATABASE_URL", b"MCP_SERVER_URL"})
+_ENV_VARIABLES_RE = token_pattern(_ENV_VARIABLES)
+
+# Directives the dashboard nginx config needs to proxy the backend
+_NGINX_PROXY_TOKENS = frozenset({b"proxy_pass", b"backend:8000"})
+_NGINX_PROXY_TOKENS_RE = token_pattern(_NGINX_PROXY_TOKENS)
+
+# Stop at the first failing suite instead of running them all concurrently
+FAIL_FAST = os.environ.get("VALIDATE_FAIL_FAST") == "1"
+
+# Report lines of whichever suite is running on the current thread
+_report = threading.local()
+
+def say(message: str = "") -> None:
+    """Add a line to the current suite's report."""
+    _report.lines.append(message)
+
+def list_directory(directory: Path) -> set:
+    """Return the entry names in a directory, or an empty set if it doesn't exist."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+@lru_cache(maxsize=128)
+def _read_bytes(file_path: Path) -> bytes:
+    """Read a file once per process."""
+    return file_path.read_bytes()
+
+@lru_cache(maxsize=128)
+def find_tokens(file_path: Path, pattern: re.Pattern) -> frozenset:
+    """Return the tokens of a token pattern that occur in a file, in one scan of its raw bytes."""
+    found = pattern.findall(_read_bytes(file_path))
+    if pattern.flags & re.IGNORECASE:
+        found = [token.lower() for token in found]
+    return frozenset(found)
+
+def format_tokens(tokens) -> list:
+    """Decode tokens into a sorted list for reporting."""
+    return sorted(token.decode() for token in tokens)
+
+def preload_files(file_paths) -> None:
+    """Read files concurrently so their reads overlap instead of stalling one after another."""
+    def read(file_path):
+        try:
+            _read_bytes(file_path)
+        except OSError:
+            pass  # Reported by the check that needs the file
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(read, file_paths))
+
+def check_file_exists(file_path: Path, description: str, present: set) -> bool:
+    """Check if a file is among its directory's entries and report the result."""
+    if file_path.name in present:
+        say(f"✅ {description}: {file_path.relative_to(ROOT)}")
         return True
     else:
-        print(f"❌ MISSING {description}: {file_path}")
+        say(f"❌ MISSING {description}: {file_path.relative_to(ROOT)}")
         return False
 
 def check_directory_structure():
     """Check if all required directories and files exist."""
-    print("🔍 Checking Project Structure...")
-    print("=" * 50)
-    
-    checks = [
-        # Root files
-        ("README.md", "Main documentation"),
-        ("docker-compose.yml", "Docker orchestration"),
-        ("init.sql", "Database initialization"),
-        ("start.sh", "Startup script"),
-        ("test_system.py", "System test script"),
-        (".env.example", "Environment template"),
-        
-        # Backend files
-        ("backend/Dockerfile", "Backend container config"),
-        ("backend/requirements.txt", "Backend dependencies"),
-        ("backend/app/__init__.py", "Backend package init"),
-        ("backend/app/main.py", "FastAPI application"),
-        ("backend/app/models.py", "Database models"),
-        ("backend/app/schemas.py", "Pydantic schemas"),
-        ("backend/app/database.py", "Database connection"),
-        ("backend/app/services/__init__.py", "Services package init"),
-        ("backend/app/services/llm_service.py", "LLM service"),
-        ("backend/app/services/mcp_client.py", "MCP client"),
-        
-        # MCP Server files
-        ("mcp_server/Dockerfile", "MCP server container config"),
-        ("mcp_server/requirements.txt", "MCP server dependencies"),
-        ("mcp_server/server.py", "MCP server implementation"),
-        ("mcp_server/resources/faq.txt", "FAQ content"),
-        ("mcp_server/prompts/query_generate.txt", "Query generation prompt"),
-        ("mcp_server/prompts/answer_generate.txt", "Answer generation prompt"),
-        
-        # Frontend files
-        ("frontend/Dockerfile", "Frontend container config"),
-        ("frontend/nginx.conf", "Nginx configuration"),
-        ("frontend/index.html", "Dashboard HTML"),
-        ("frontend/style.css", "Dashboard CSS"),
-        ("frontend/script.js", "Dashboard JavaScript"),
-        
-        # Chat Interface files
-        ("chat_interface/Dockerfile", "Chat interface container config"),
-        ("chat_interface/nginx.conf", "Chat interface nginx config"),
-        ("chat_interface/index.html", "Chat interface HTML"),
-        ("chat_interface/chat.css", "Chat interface CSS"),
-        ("chat_interface/chat.js", "Chat interface JavaScript"),
-    ]
+    say("🔍 Checking Project Structure...")
+    say("=" * 50)
     
     passed = 0
-    total = len(checks)
+    total = len(_CHECKS)
     
-    for file_path, description in checks:
-        if check_file_exists(file_path, description):
+    # Read each directory once instead of stat-ing every file
+    listings = {}
+    for file_path, description in _CHECKS:
+        directory = file_path.parent
+        if directory not in listings:
+            listings[directory] = list_directory(directory)
+        if check_file_exists(file_path, description, listings[directory]):
             passed += 1
     
-    print(f"\n📊 File Structure: {passed}/{total} files present")
+    say(f"\n📊 File Structure: {passed}/{total} files present")
     return passed == total
 
 def check_file_contents():
     """Check critical file contents for required components."""
-    print("\n🔍 Checking File Contents...")
-    print("=" * 50)
+    say("\n🔍 Checking File Contents...")
+    say("=" * 50)
     
     checks_passed = 0
     total_checks = 0
@@ -87,75 +197,70 @@ def check_file_contents():
     # Check docker-compose.yml
     total_checks += 1
     try:
-        with open("docker-compose.yml", 'r') as f:
-            content = f.read()
-            if all(service in content for service in ["postgres", "pgadmin", "mcp_server", "backend", "frontend"]):
-                print("✅ docker-compose.yml contains all required services")
-                checks_passed += 1
-            else:
-                print("❌ docker-compose.yml missing required services")
+        missing = _COMPOSE_SERVICES - find_tokens(ROOT / "docker-compose.yml", _COMPOSE_SERVICES_RE)
+        if not missing:
+            say("✅ docker-compose.yml contains all required services")
+            checks_passed += 1
+        else:
+            say(f"❌ docker-compose.yml missing required services: {format_tokens(missing)}")
     except Exception as e:
-        print(f"❌ Error reading docker-compose.yml: {e}")
+        say(f"❌ Error reading docker-compose.yml: {e}")
     
     # Check backend main.py
     total_checks += 1
     try:
-        with open("backend/app/main.py", 'r') as f:
-            content = f.read()
-            if all(endpoint in content for endpoint in ["/query_generate", "/answer_generate", "/chat", "/messages"]):
-                print("✅ Backend contains all required endpoints")
-                checks_passed += 1
-            else:
-                print("❌ Backend missing required endpoints")
+        missing = _BACKEND_ENDPOINTS - find_tokens(ROOT / "backend/app/main.py", _BACKEND_ENDPOINTS_RE)
+        if not missing:
+            say("✅ Backend contains all required endpoints")
+            checks_passed += 1
+        else:
+            say(f"❌ Backend missing required endpoints: {format_tokens(missing)}")
     except Exception as e:
-        print(f"❌ Error reading backend main.py: {e}")
+        say(f"❌ Error reading backend main.py: {e}")
     
     # Check MCP server
     total_checks += 1
     try:
-        with open("mcp_server/server.py", 'r') as f:
-            content = f.read()
-            if all(route in content for route in ["/resources/faq", "/prompts/query_generate", "/prompts/answer_generate"]):
-                print("✅ MCP server contains all required routes")
-                checks_passed += 1
-            else:
-                print("❌ MCP server missing required routes")
+        missing = _MCP_ROUTES - find_tokens(ROOT / "mcp_server/server.py", _MCP_ROUTES_RE)
+        if not missing:
+            say("✅ MCP server contains all required routes")
+            checks_passed += 1
+        else:
+            say(f"❌ MCP server missing required routes: {format_tokens(missing)}")
     except Exception as e:
-        print(f"❌ Error reading MCP server.py: {e}")
+        say(f"❌ Error reading MCP server.py: {e}")
     
     # Check frontend has dashboard functionality
     total_checks += 1
     try:
-        with open("frontend/script.js", 'r') as f:
-            content = f.read()
-            if all(func in content for func in ["loadMessages", "loadStats", "searchMessages", "showMessageDetails"]):
-                print("✅ Frontend contains dashboard functionality")
-                checks_passed += 1
-            else:
-                print("❌ Frontend missing dashboard functionality")
+        missing = _DASHBOARD_FUNCTIONS - find_tokens(ROOT / "frontend/script.js", _DASHBOARD_FUNCTIONS_RE)
+        if not missing:
+            say("✅ Frontend contains dashboard functionality")
+            checks_passed += 1
+        else:
+            say(f"❌ Frontend missing dashboard functionality: {format_tokens(missing)}")
     except Exception as e:
-        print(f"❌ Error reading frontend script.js: {e}")
+        say(f"❌ Error reading frontend script.js: {e}")
     
     # Check FAQ content exists
     total_checks += 1
     try:
-        with open("mcp_server/resources/faq.txt", 'r') as f:
-            content = f.read()
-            if len(content.strip()) > 100 and "Q:" in content and "A:" in content:
-                print("✅ FAQ content is properly formatted")
-                checks_passed += 1
-            else:
-                print("❌ FAQ content is insufficient or improperly formatted")
+        content = _read_bytes(ROOT / "mcp_server/resources/faq.txt")
+        if len(content.strip()) > 100 and b"Q:" in content and b"A:" in content:
+            say("✅ FAQ content is properly formatted")
+            checks_passed += 1
+        else:
+            say("❌ FAQ content is insufficient or improperly formatted")
     except Exception as e:
-        print(f"❌ Error reading FAQ content: {e}")
+        say(f"❌ Error reading FAQ content: {e}")
     
-    print(f"\n📊 Content Validation: {checks_passed}/{total_checks} checks passed")
+    say(f"\n📊 Content Validation: {checks_passed}/{total_checks} checks passed")
     return checks_passed == total_checks
 
 def check_requirements():
     """Check that all requirements files have necessary dependencies."""
-    print("\n🔍 Checking Dependencies...")
-    print("=" * 50)
+    say("\n🔍 Checking Dependencies...")
+    say("=" * 50)
     
     checks_passed = 0
     total_checks = 0
@@ -163,40 +268,34 @@ def check_requirements():
     # Backend requirements
     total_checks += 1
     try:
-        with open("backend/requirements.txt", 'r') as f:
-            content = f.read()
-            required = ["fastapi", "uvicorn", "sqlalchemy", "asyncpg", "langchain", "langchain-openai", "httpx"]
-            if all(req in content.lower() for req in required):
-                print("✅ Backend requirements contain all necessary packages")
-                checks_passed += 1
-            else:
-                missing = [req for req in required if req not in content.lower()]
-                print(f"❌ Backend requirements missing: {missing}")
+        missing = _BACKEND_PACKAGES - find_tokens(ROOT / "backend/requirements.txt", _BACKEND_PACKAGES_RE)
+        if not missing:
+            say("✅ Backend requirements contain all necessary packages")
+            checks_passed += 1
+        else:
+            say(f"❌ Backend requirements missing: {format_tokens(missing)}")
     except Exception as e:
-        print(f"❌ Error reading backend requirements: {e}")
+        say(f"❌ Error reading backend requirements: {e}")
     
     # MCP server requirements
     total_checks += 1
     try:
-        with open("mcp_server/requirements.txt", 'r') as f:
-            content = f.read()
-            required = ["fastapi", "uvicorn"]
-            if all(req in content.lower() for req in required):
-                print("✅ MCP server requirements contain necessary packages")
-                checks_passed += 1
-            else:
-                missing = [req for req in required if req not in content.lower()]
-                print(f"❌ MCP server requirements missing: {missing}")
+        missing = _MCP_PACKAGES - find_tokens(ROOT / "mcp_server/requirements.txt", _MCP_PACKAGES_RE)
+        if not missing:
+            say("✅ MCP server requirements contain necessary packages")
+            checks_passed += 1
+        else:
+            say(f"❌ MCP server requirements missing: {format_tokens(missing)}")
     except Exception as e:
-        print(f"❌ Error reading MCP server requirements: {e}")
+        say(f"❌ Error reading MCP server requirements: {e}")
     
-    print(f"\n📊 Dependencies: {checks_passed}/{total_checks} requirement files valid")
+    say(f"\n📊 Dependencies: {checks_passed}/{total_checks} requirement files valid")
     return checks_passed == total_checks
 
 def check_configuration():
     """Check configuration files and environment setup."""
-    print("\n🔍 Checking Configuration...")
-    print("=" * 50)
+    say("\n🔍 Checking Configuration...")
+    say("=" * 50)
     
     checks_passed = 0
     total_checks = 0
@@ -204,92 +303,119 @@ def check_configuration():
     # Check .env.example
     total_checks += 1
     try:
-        with open(".env.example", 'r') as f:
-            content = f.read()
-            required_vars = ["OPENAI_API_KEY", "DATABASE_URL", "MCP_SERVER_URL"]
-            if all(var in content for var in required_vars):
-                print("✅ .env.example contains all required variables")
-                checks_passed += 1
-            else:
-                missing = [var for var in required_vars if var not in content]
-                print(f"❌ .env.example missing variables: {missing}")
+        missing = _ENV_VARIABLES - find_tokens(ROOT / ".env.example", _ENV_VARIABLES_RE)
+        if not missing:
+            say("✅ .env.example contains all required variables")
+            checks_passed += 1
+        else:
+            say(f"❌ .env.example missing variables: {format_tokens(missing)}")
     except Exception as e:
-        print(f"❌ Error reading .env.example: {e}")
+        say(f"❌ Error reading .env.example: {e}")
     
     # Check nginx configuration
     total_checks += 1
     try:
-        with open("frontend/nginx.conf", 'r') as f:
-            content = f.read()
-            if "proxy_pass" in content and "backend:8000" in content:
-                print("✅ Nginx configuration has proper backend proxy")
-                checks_passed += 1
-            else:
-                print("❌ Nginx configuration missing proper backend proxy")
+        missing = _NGINX_PROXY_TOKENS - find_tokens(ROOT / "frontend/nginx.conf", _NGINX_PROXY_TOKENS_RE)
+        if not missing:
+            say("✅ Nginx configuration has proper backend proxy")
+            checks_passed += 1
+        else:
+            say(f"❌ Nginx configuration missing proper backend proxy: {format_tokens(missing)}")
     except Exception as e:
-        print(f"❌ Error reading nginx.conf: {e}")
+        say(f"❌ Error reading nginx.conf: {e}")
     
-    print(f"\n📊 Configuration: {checks_passed}/{total_checks} configuration files valid")
+    say(f"\n📊 Configuration: {checks_passed}/{total_checks} configuration files valid")
     return checks_passed == total_checks
 
 def check_executable_permissions():
     """Check that scripts have executable permissions."""
-    print("\n🔍 Checking Executable Permissions...")
-    print("=" * 50)
+    say("\n🔍 Checking Executable Permissions...")
+    say("=" * 50)
     
     scripts = ["start.sh", "test_system.py"]
     checks_passed = 0
     
     for script in scripts:
-        if os.path.exists(script):
-            if os.access(script, os.X_OK):
-                print(f"✅ {script} is executable")
-                checks_passed += 1
-            else:
-                print(f"⚠️  {script} is not executable (run: chmod +x {script})")
+        try:
+            mode = os.stat(ROOT / script).st_mode
+        except FileNotFoundError:
+            say(f"❌ {script} not found")
+            continue
+        if mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH):
+            say(f"✅ {script} is executable")
+            checks_passed += 1
         else:
-            print(f"❌ {script} not found")
+            say(f"⚠️  {script} is not executable (run: chmod +x {script})")
     
-    print(f"\n📊 Permissions: {checks_passed}/{len(scripts)} scripts executable")
+    say(f"\n📊 Permissions: {checks_passed}/{len(scripts)} scripts executable")
     return checks_passed == len(scripts)
 
-def main():
+def run_captured(suite):
+    """Run a suite in its own report buffer, returning its result and report lines."""
+    _report.lines = lines = []
+    try:
+        return suite(), lines
+    finally:
+        del _report.lines
+
+async def main():
     """Run all validation checks."""
-    print("🚀 RAG Chatbot System Validation")
-    print("=" * 60)
-    
-    # Change to project directory
-    os.chdir(Path(__file__).parent)
-    
-    all_checks = [
-        check_directory_structure(),
-        check_file_contents(),
-        check_requirements(),
-        check_configuration(),
-        check_executable_permissions()
+    _report.lines = lines = []
+    
+    say("🚀 RAG Chatbot System Validation")
+    say("=" * 60)
+    
+    suites = [
+        check_directory_structure,
+        check_file_contents,
+        check_requirements,
+        check_configuration,
+        check_executable_permissions
     ]
     
+    all_checks = []
+    if FAIL_FAST:
+        # Run suites in order, skipping the reads of any after a failure
+        for suite in suites:
+            all_checks.append(suite())
+            if not all_checks[-1]:
+                say("\n⏭️  Skipping remaining suites (VALIDATE_FAIL_FAST=1)")
+                break
+    else:
+        # Suites are independent and I/O-bound, so run them side by side and
+        # report their lines in the original order
+        preload_files(_CONTENT_FILES)
+        results = await asyncio.gather(*(
+            asyncio.to_thread(run_captured, suite) for suite in suites
+        ))
+        for passed, suite_lines in results:
+            lines.extend(suite_lines)
+            all_checks.append(passed)
+    
     passed_checks = sum(all_checks)
-    total_checks = len(all_checks)
+    total_checks = len(suites)
     
-    print("\n" + "=" * 60)
-    print(f"📊 FINAL RESULT: {passed_checks}/{total_checks} validation suites passed")
+    say("\n" + "=" * 60)
+    say(f"📊 FINAL RESULT: {passed_checks}/{total_checks} validation suites passed")
     
     if passed_checks == total_checks:
-        print("🎉 ALL VALIDATIONS PASSED!")
-        print("\n✨ Your RAG Chatbot system is complete and ready to use!")
-        print("\n🚀 Quick Start:")
-        print("   1. Copy .env.example to .env")
-        print("   2. Add your OPENAI_API_KEY to .env")
-        print("   3. Run: ./start.sh")
-        print("   4. Access Chat: http://localhost:3001")
-        print("   5. Access Dashboard: http://localhost:3000")
-        return 0
+        say("🎉 ALL VALIDATIONS PASSED!")
+        say("\n✨ Your RAG Chatbot system is complete and ready to use!")
+        say("\n🚀 Quick Start:")
+        say("   1. Copy .env.example to .env")
+        say("   2. Add your OPENAI_API_KEY to .env")
+        say("   3. Run: ./start.sh")
+        say("   4. Access Chat: http://localhost:3001")
+        say("   5. Access Dashboard: http://localhost:3000")
+        exit_code = 0
     else:
-        print("❌ VALIDATION FAILED!")
-        print(f"\n🔧 Please fix the issues above before proceeding.")
-        return 1
+        say("❌ VALIDATION FAILED!")
+        say(f"\n🔧 Please fix the issues above before proceeding.")
+        exit_code = 1
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    return exit_code
 
 if __name__ == "__main__":
-    exit_code = main()
+    exit_code = asyncio.run(main())
     sys.exit(exit_code)
\ No newline at end of file